@@ -102,6 +102,7 @@ class GEDependencies:
             "pytest-order",
             "pytest-random-order",
             "pytest-timeout",
+            "pytest-xdist",
             "pyupgrade",
             "requirements-parser",
             "s3fs",
@@ -129,6 +130,7 @@ class GEDependencies:
         "pytest-cov",
         "pytest-order",
         "pytest-random-order",
+        "pytest-xdist",
         "pyupgrade",
         # requirements-dev-lite.txt:
         "flask",
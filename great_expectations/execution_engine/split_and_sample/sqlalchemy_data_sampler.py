@@ -1,4 +1,6 @@
-from typing import Optional, Union
+import math
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import BatchSpec
@@ -13,25 +15,96 @@ except ImportError:
     sa = None
 
 try:
+    from sqlalchemy.dialects.postgresql import BIT
     from sqlalchemy.engine import Dialect
     from sqlalchemy.sql import Selectable
     from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 except ImportError:
+    BIT = None
     Selectable = None
     BinaryExpression = None
     BooleanClauseList = None
     Dialect = None
 
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+
+# Dialects whose TABLESAMPLE clause supports row-level (Bernoulli) sampling in the form SqlAlchemy's
+# FromClause.tablesample() renders it, mapped to the name of the sampling method.
+# Used by sample_using_random only when "use_tablesample" is requested.
+_TABLESAMPLE_METHOD_FOR_DIALECT: Dict[str, str] = {
+    GESqlDialect.POSTGRESQL.value: "bernoulli",
+    GESqlDialect.SNOWFLAKE.value: "bernoulli",
+    GESqlDialect.TRINO.value: "bernoulli",
+}
+
+# Unsubstituted TOP placeholder ("TOP ?" or "TOP (?)"), anchored to the leading SELECT of the query.
+_MSSQL_TOP_PLACEHOLDER_RE = re.compile(
+    r"^(\s*SELECT\s+(?:DISTINCT\s+)?)TOP\s*(?:\(\s*\?\s*\)|\?)", re.IGNORECASE
+)
+
+# Dialects accepting a scalar subquery in LIMIT, so that counting and sampling happen in one statement.
+_SCALAR_SUBQUERY_LIMIT_DIALECTS = {
+    GESqlDialect.SQLITE,
+}
+
+# Number of trailing md5 hex digits that are converted to an integer for hash-based sampling.
+_MD5_INTEGER_SUFFIX_HEX_DIGITS: int = 8
+
+# Characters of an md5 hex digest, as rendered by md5() in SQL.
+_MD5_HEX_DIGITS_RE = re.compile(r"[0-9a-f]+")
+
+
+def _hex_to_integer_postgresql(hex_string):
+    # ('x' || hex_string)::bit(32)::bigint
+    return sa.cast(
+        sa.cast(
+            sa.literal_column("'x'").concat(hex_string),
+            BIT(4 * _MD5_INTEGER_SUFFIX_HEX_DIGITS),
+        ),
+        sa.BigInteger,
+    )
+
+
+def _hex_to_integer_mysql(hex_string):
+    return sa.func.conv(hex_string, 16, 10)
+
+
+_HEX_TO_INTEGER_FOR_DIALECT: Dict[str, Callable] = {
+    GESqlDialect.POSTGRESQL.value: _hex_to_integer_postgresql,
+    GESqlDialect.MYSQL.value: _hex_to_integer_mysql,
+}
+
+# Cheaper non-cryptographic hashes, used by sample_using_md5 when "use_native_hash" is requested.
+_HASH_FUNC_FOR_DIALECT: Dict[str, Callable] = {
+    GESqlDialect.BIGQUERY.value: lambda column: sa.func.farm_fingerprint(
+        sa.cast(column, sa.Text)
+    ),
+    GESqlDialect.SNOWFLAKE.value: lambda column: sa.func.hash(column),
+    GESqlDialect.POSTGRESQL.value: lambda column: sa.func.hashtext(
+        sa.cast(column, sa.Text)
+    ),
+    GESqlDialect.MYSQL.value: lambda column: sa.func.crc32(sa.cast(column, sa.Text)),
+}
+
 
 class SqlAlchemyDataSampler(DataSampler):
     """Sampling methods for data stores with SQL interfaces."""
 
+    def __init__(self) -> None:
+        # Dialects that cannot use a plain limit(); all other dialects, except mssql, use _apply_limit.
+        self._limit_builders: Dict[str, Callable] = {
+            GESqlDialect.ORACLE.value: self._apply_limit_oracle,
+        }
+
     def sample_using_limit(
         self,
-        execution_engine: "SqlAlchemyExecutionEngine",  # noqa: F821
+        execution_engine: "SqlAlchemyExecutionEngine",
         batch_spec: BatchSpec,
         where_clause: Optional[Selectable] = None,
-    ) -> Union[str, BinaryExpression, BooleanClauseList]:
+    ) -> Union[str, Selectable]:
         """Sample using a limit with configuration provided via the batch_spec.
 
         Note: where_clause needs to be included at this stage since SqlAlchemy's semantics
@@ -46,106 +119,158 @@ class SqlAlchemyDataSampler(DataSampler):
             where_clause: Optional clause used in WHERE clause. Typically generated by a splitter.
 
         Returns:
-            A query as a string or sqlalchemy object.
+            A sqlalchemy selectable, or a query string for mssql.
         """
 
+        table_name: str = batch_spec["table_name"]
+        schema_name: Optional[str] = batch_spec.get("schema_name", None)
+        n: Union[str, int] = batch_spec["sampling_kwargs"]["n"]
+
         # Split clause should be permissive of all values if not supplied.
+        dialect_name: str = execution_engine.dialect_name
         if where_clause is None:
-            if execution_engine.dialect_name == GESqlDialect.SQLITE:
+            if dialect_name in [GESqlDialect.SQLITE, GESqlDialect.ORACLE]:
                 where_clause = sa.text("1 = 1")
             else:
                 where_clause = sa.true()
 
-        table_name: str = batch_spec["table_name"]
-
         # SQLalchemy's semantics for LIMIT are different than normal WHERE clauses,
         # so the business logic for building the query needs to be different.
-        dialect_name: str = execution_engine.dialect_name
-        if dialect_name == GESqlDialect.ORACLE:
-            # TODO: AJB 20220429 WARNING THIS oracle dialect METHOD IS NOT COVERED BY TESTS
-            # limit doesn't compile properly for oracle so we will append rownum to query string later
-            raw_query: Selectable = (
-                sa.select("*")
-                .select_from(
-                    sa.table(table_name, schema=batch_spec.get("schema_name", None))
-                )
-                .where(where_clause)
-            )
-            query: str = str(
-                raw_query.compile(
-                    dialect=execution_engine.dialect,
-                    compile_kwargs={"literal_binds": True},
-                )
-            )
-            query += "\nAND ROWNUM <= %d" % batch_spec["sampling_kwargs"]["n"]
-            return query
-        elif dialect_name == GESqlDialect.MSSQL:
-            # Note that this code path exists because the limit parameter is not getting rendered
-            # successfully in the resulting mssql query.
-            selectable_query: Selectable = (
-                sa.select("*")
-                .select_from(
-                    sa.table(table_name, schema=batch_spec.get("schema_name", None))
-                )
-                .where(where_clause)
-                .limit(batch_spec["sampling_kwargs"]["n"])
-            )
-            string_of_query: str = str(
-                selectable_query.compile(
-                    dialect=execution_engine.dialect,
-                    compile_kwargs={"literal_binds": True},
-                )
-            )
-            n: Union[str, int] = batch_spec["sampling_kwargs"]["n"]
-            self._validate_mssql_limit_param(n)
-            # This string replacement is here because the limit parameter is not substituted during query.compile()
-            string_of_query = string_of_query.replace("?", str(n))
-            return string_of_query
-        else:
-            return (
-                sa.select("*")
-                .select_from(
-                    sa.table(table_name, schema=batch_spec.get("schema_name", None))
-                )
-                .where(where_clause)
-                .limit(batch_spec["sampling_kwargs"]["n"])
+        raw_query: Selectable = (
+            sa.select("*")
+            .select_from(sa.table(table_name, schema=schema_name))
+            .where(where_clause)
+        )
+        if dialect_name == GESqlDialect.MSSQL:
+            # The mssql query is compiled to a string, for the dialect of the engine.
+            return self._apply_limit_mssql(execution_engine, raw_query, n)
+
+        limit_builder: Callable = self._limit_builders.get(
+            dialect_name, self._apply_limit
+        )
+        return limit_builder(raw_query, n)
+
+    @staticmethod
+    def _apply_limit(
+        raw_query: Selectable,
+        n: Union[str, int],
+    ) -> Selectable:
+        """Apply a LIMIT to the query, for dialects that render limit() correctly.
+
+        Args:
+            raw_query: Query to limit.
+            n: Number of rows to keep.
+
+        Returns:
+            Sqlalchemy selectable.
+        """
+        return raw_query.limit(n)
+
+    @staticmethod
+    def _apply_limit_oracle(
+        raw_query: Selectable,
+        n: Union[str, int],
+    ) -> Selectable:
+        """Apply a ROWNUM condition to the query in place of a LIMIT for oracle.
+
+        Args:
+            raw_query: Query to limit.
+            n: Number of rows to keep.
+
+        Returns:
+            Sqlalchemy selectable.
+        """
+        # limit() wraps the query in a subquery for oracle, so filter on ROWNUM directly instead.
+        return raw_query.where(
+            sa.literal_column("ROWNUM")
+            <= sa.bindparam("n", n, type_=sa.Integer, unique=True)
+        )
+
+    def _apply_limit_mssql(
+        self,
+        execution_engine: "SqlAlchemyExecutionEngine",
+        raw_query: Selectable,
+        n: Union[str, int],
+    ) -> str:
+        """Apply a LIMIT to the query and compile it to a string for mssql.
+
+        Args:
+            execution_engine: Engine used to connect to the database.
+            raw_query: Query to limit.
+            n: Number of rows to keep.
+
+        Returns:
+            A query as a string.
+        """
+        # Note that this code path exists because the limit parameter is not getting rendered
+        # successfully in the resulting mssql query.
+        n_int: int = self._validate_mssql_limit_param(n)
+        selectable_query: Selectable = raw_query.limit(n_int)
+        string_of_query: str = str(
+            selectable_query.compile(
+                dialect=execution_engine.dialect,
+                compile_kwargs={"literal_binds": True},
             )
+        )
+        # This string replacement is here because the limit parameter is not substituted during query.compile()
+        # Only the TOP placeholder is replaced so that "?" characters inside literal values are left intact.
+        string_of_query = _MSSQL_TOP_PLACEHOLDER_RE.sub(
+            rf"\g<1>TOP {n_int}", string_of_query, count=1
+        )
+        return string_of_query
 
     @staticmethod
-    def _validate_mssql_limit_param(n: Union[str, int]) -> None:
+    def _validate_mssql_limit_param(n: Union[str, int]) -> int:
         """Validate that the mssql limit param is passed as an int or a string representation of an int.
 
         Args:
             n: mssql limit parameter.
 
         Returns:
-            None
+            The limit parameter coerced to an int.
+
+        Raises:
+            InvalidConfigError
         """
         if not isinstance(n, (str, int)):
             raise ge_exceptions.InvalidConfigError(
                 "Please specify your sampling kwargs 'n' parameter as a string or int."
             )
-        if isinstance(n, str) and not n.isdigit():
+        try:
+            n_int: int = int(n)
+        except ValueError:
             raise ge_exceptions.InvalidConfigError(
                 "If specifying your sampling kwargs 'n' parameter as a string please ensure it is "
                 "parseable as an integer."
             )
+        if n_int < 0:
+            raise ge_exceptions.InvalidConfigError(
+                "Please specify your sampling kwargs 'n' parameter as a non-negative integer."
+            )
+        return n_int
 
     @staticmethod
     def sample_using_random(
-        execution_engine: "SqlAlchemyExecutionEngine",  # noqa: F821
+        execution_engine: "SqlAlchemyExecutionEngine",
         batch_spec: BatchSpec,
         where_clause: Optional[Selectable] = None,
     ) -> Selectable:
         """Sample using random data with configuration provided via the batch_spec.
 
-        Note: where_clause needs to be included at this stage since we use the where clause
-        to determine the total number of rows to use in determining the rows returned in the
-        sample fraction.
+        Note: the where_clause needs to be included at this stage since it is used to determine the
+        total number of rows to use in determining the rows returned in the sample fraction (exactly
+        p * number of rows, rounded half up, rows are returned); where the dialect allows it, that count is
+        computed as a subquery of the sampling query rather than as a separate query.
+
+        If `use_tablesample` is set and the dialect supports row-level TABLESAMPLE (PostgreSQL, Snowflake
+        and Trino), each row is instead kept independently with probability p (the same semantics as the
+        pandas and spark samplers), without counting or sorting the table. The number of rows returned
+        then varies around p * number of rows.
 
         Args:
             execution_engine: Engine used to connect to the database.
-            batch_spec: Batch specification describing the batch of interest.
+            batch_spec: Batch specification describing the batch of interest; its sampling_kwargs
+                should contain key `p` and optionally `use_tablesample` (default is False if not provided).
             where_clause: Optional clause used in WHERE clause. Typically generated by a splitter.
 
         Returns:
@@ -155,21 +280,60 @@ class SqlAlchemyDataSampler(DataSampler):
         # TODO: AJB 20220429 WARNING THIS METHOD IS NOT COVERED BY TESTS
 
         table_name: str = batch_spec["table_name"]
+        p: float = batch_spec["sampling_kwargs"]["p"] or 1.0
+        if where_clause is None:
+            # .where(None) would render "WHERE NULL" and filter out every row.
+            where_clause = sa.true()
+        table: Selectable = sa.table(
+            table_name, schema=batch_spec.get("schema_name", None)
+        )
 
-        num_rows: int = execution_engine.engine.execute(
-            sa.select([sa.func.count()])
-            .select_from(
-                sa.table(table_name, schema=batch_spec.get("schema_name", None))
+        if p >= 1.0:
+            # Every row is kept, so there is nothing to count, sample or sort.
+            return sa.select("*").select_from(table).where(where_clause)
+
+        tablesample_method: Optional[str] = None
+        if batch_spec["sampling_kwargs"].get("use_tablesample", False):
+            tablesample_method = _TABLESAMPLE_METHOD_FOR_DIALECT.get(
+                execution_engine.dialect_name
             )
-            .where(where_clause)
-        ).scalar()
-        p: float = batch_spec["sampling_kwargs"]["p"] or 1.0
-        sample_size: int = round(p * num_rows)
+
+        if tablesample_method is not None:
+            # TABLESAMPLE avoids both the COUNT round-trip and the sort of the entire table.
+            return (
+                sa.select("*")
+                .select_from(
+                    table.tablesample(
+                        getattr(sa.func, tablesample_method)(p * 100), name=table_name
+                    )
+                )
+                .where(where_clause)
+            )
+
+        sample_size: Union[int, Selectable]
+        if execution_engine.dialect_name in _SCALAR_SUBQUERY_LIMIT_DIALECTS:
+            # Count the rows inside the sampling query itself, saving a round-trip to the database.
+            # (p * count is non-negative, so truncating it after adding 0.5 rounds half up.)
+            sample_size_query: Selectable = (
+                sa.select([sa.cast(p * sa.func.count() + 0.5, sa.Integer)])
+                .select_from(table)
+                .where(where_clause)
+            )
+            if hasattr(sample_size_query, "scalar_subquery"):
+                sample_size = sample_size_query.scalar_subquery()
+            else:
+                # SqlAlchemy < 1.4
+                sample_size = sample_size_query.as_scalar()
+        else:
+            num_rows: int = execution_engine.engine.execute(
+                sa.select([sa.func.count()]).select_from(table).where(where_clause)
+            ).scalar()
+            # Python's round() rounds half to even, so round half up explicitly, as in the subquery above.
+            sample_size = math.floor(p * num_rows + 0.5)
+
         return (
             sa.select("*")
-            .select_from(
-                sa.table(table_name, schema=batch_spec.get("schema_name", None))
-            )
+            .select_from(table)
             .where(where_clause)
             .order_by(sa.func.random())
             .limit(sample_size)
@@ -226,17 +390,33 @@ class SqlAlchemyDataSampler(DataSampler):
         value_list: list = self.get_sampling_kwargs_value_or_default(
             batch_spec, "value_list"
         )
-        return sa.column(column_name).in_(value_list)
+        # in_() with a list is rendered through a single "expanding" bind parameter,
+        # so the compiled form does not depend on the length or contents of value_list.
+        return sa.column(column_name).in_(tuple(value_list))
 
     def sample_using_md5(
         self,
         batch_spec: BatchSpec,
+        execution_engine: Optional["SqlAlchemyExecutionEngine"] = None,
     ) -> Selectable:
         """Hash the values in the named column using md5, and only keep rows that match the given hash_value.
 
+        Note: for dialects able to convert hex strings to integers natively, the trailing digits of the
+        hash are compared as an integer (modulo 16 ** hash_digits) rather than as a string. Only the last 8 hex
+        digits of the hash are converted, so larger values of hash_digits always use the string comparison. So do
+        values of hash_value not written the way md5 renders them (exactly hash_digits lower-case hex digits),
+        which therefore still match no rows.
+
+        If `use_native_hash` is set and the dialect provides a cheaper non-cryptographic hash
+        (FARM_FINGERPRINT, HASH, hashtext or CRC32), that hash is bucketed instead of md5. The rows
+        selected then differ from the md5-based selection used by other execution engines. Native hashes may only
+        be 32 bits wide, so they are not used for hash_digits greater than 8.
+
         Args:
             batch_spec: should contain keys `column_name` and optionally `hash_digits`
-                (default is 1 if not provided), `hash_value` (default is "f" if not provided)
+                (default is 1 if not provided), `hash_value` (default is "f" if not provided),
+                `use_native_hash` (default is False if not provided)
+            execution_engine: Optional engine used to find the dialect the query will be compiled for.
 
         Returns:
             Sampled selectable
@@ -256,9 +436,92 @@ class SqlAlchemyDataSampler(DataSampler):
             batch_spec=batch_spec, sampling_kwargs_key="hash_value", default_value="f"
         )
 
+        use_native_hash: bool = bool(
+            self.get_sampling_kwargs_value_or_default(
+                batch_spec=batch_spec,
+                sampling_kwargs_key="use_native_hash",
+                default_value=False,
+            )
+        )
+
+        # Both integer comparisons below work on at most 32 bits, which a modulus above 16 ** 8 would exceed.
+        integer_comparable: bool = hash_digits <= _MD5_INTEGER_SUFFIX_HEX_DIGITS
+
+        hash_func = None
+        if use_native_hash and execution_engine is not None and integer_comparable:
+            hash_func = _HASH_FUNC_FOR_DIALECT.get(execution_engine.dialect_name)
+
+        if hash_func is not None:
+            modulus: int = 16**hash_digits
+            # Native hashes may be negative, so normalize the remainder into [0, modulus).
+            return sa.func.mod(
+                sa.func.mod(hash_func(sa.column(column_name)), modulus) + modulus,
+                modulus,
+            ) == self._parse_hex_hash_value(hash_value)
+
+        hex_to_integer = None
+        if (
+            execution_engine is not None
+            and integer_comparable
+            and self._is_md5_hex_suffix(hash_value, hash_digits)
+        ):
+            hex_to_integer = _HEX_TO_INTEGER_FOR_DIALECT.get(
+                execution_engine.dialect_name
+            )
+
+        if hex_to_integer is not None:
+            hash_value_as_integer: int = self._parse_hex_hash_value(hash_value)
+            return (
+                hex_to_integer(
+                    sa.func.right(
+                        sa.func.md5(sa.cast(sa.column(column_name), sa.Text)),
+                        _MD5_INTEGER_SUFFIX_HEX_DIGITS,
+                    )
+                )
+                % 16**hash_digits
+                == hash_value_as_integer
+            )
+
         return (
             sa.func.right(
                 sa.func.md5(sa.cast(sa.column(column_name), sa.Text)), hash_digits
             )
             == hash_value
         )
+
+    @staticmethod
+    def _is_md5_hex_suffix(hash_value: str, hash_digits: int) -> bool:
+        """Check whether hash_value could equal the last hash_digits characters of an md5 hex digest.
+
+        Args:
+            hash_value: hash_value sampling kwarg.
+            hash_digits: hash_digits sampling kwarg.
+
+        Returns:
+            True if hash_value consists of exactly hash_digits lower-case hexadecimal digits.
+        """
+        return (
+            isinstance(hash_value, str)
+            and len(hash_value) == hash_digits
+            and _MD5_HEX_DIGITS_RE.fullmatch(hash_value) is not None
+        )
+
+    @staticmethod
+    def _parse_hex_hash_value(hash_value: str) -> int:
+        """Parse the hash_value sampling kwarg as a hexadecimal integer.
+
+        Args:
+            hash_value: hexadecimal string to parse.
+
+        Returns:
+            The parsed integer.
+
+        Raises:
+            SamplerError
+        """
+        try:
+            return int(hash_value, 16)
+        except ValueError:
+            raise ge_exceptions.SamplerError(
+                "Please make sure the hash_value key in sampling_kwargs is a hexadecimal string."
+            )
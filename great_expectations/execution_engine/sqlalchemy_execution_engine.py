@@ -1165,6 +1165,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             else:
                 sampler_fn = self._data_sampler.get_sampler_method(sampling_method)
+                sample_clause: Selectable
+                if sampling_method in [
+                    "_sample_using_md5",
+                    "sample_using_md5",
+                ]:
+                    # hash-based sampling is rendered differently depending on the dialect.
+                    sample_clause = sampler_fn(
+                        batch_spec=batch_spec,
+                        execution_engine=self,
+                    )
+                else:
+                    sample_clause = sampler_fn(batch_spec)
+
                 return (
                     sa.select("*")
                     .select_from(
@@ -1173,7 +1186,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     .where(
                         sa.and_(
                             split_clause,
-                            sampler_fn(batch_spec),
+                            sample_clause,
                         )
                     )
                 )
@@ -791,12 +791,20 @@ def compute_bootstrap_quantiles_point_estimate(
             metric_values, size=(n_resamples, metric_values.size)
         )
 
+    # Both quantiles are computed in a single pass, so that each bootstrap sample is partitioned only once.
+    bootstrap_lower_quantiles: np.ndarray
+    bootstrap_upper_quantiles: np.ndarray
+    bootstrap_lower_quantiles, bootstrap_upper_quantiles = numpy_quantile(
+        bootstraps,
+        q=[lower_quantile_pct, upper_quantile_pct],
+        axis=1,
+        method=quantile_statistic_interpolation_method,
+    )
+
     lower_quantile_bias_corrected_point_estimate: Union[
         np.float64, datetime.datetime
     ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=lower_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bootstrap_quantiles=bootstrap_lower_quantiles,
         quantile_bias_correction=quantile_bias_correction,
         quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
         sample_quantile=sample_lower_quantile,
@@ -804,9 +812,7 @@ def compute_bootstrap_quantiles_point_estimate(
     upper_quantile_bias_corrected_point_estimate: Union[
         np.float64, datetime.datetime
     ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=upper_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bootstrap_quantiles=bootstrap_upper_quantiles,
         quantile_bias_correction=quantile_bias_correction,
         quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
         sample_quantile=sample_upper_quantile,
@@ -869,19 +875,11 @@ def build_numeric_range_estimation_result(
 
 
 def _determine_quantile_bias_corrected_point_estimate(
-    bootstraps: np.ndarray,
-    quantile_pct: float,
-    quantile_statistic_interpolation_method: str,
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     sample_quantile: np.ndarray,
 ) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
     bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
     bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
     bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
@@ -37,6 +37,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -1319,15 +1320,17 @@ def deep_filter_properties_iterable(
         key: str
         value: Any
         for key, value in properties.items():
-            deep_filter_properties_iterable(
-                properties=value,
-                keep_fields=keep_fields,
-                delete_fields=delete_fields,
-                clean_nulls=clean_nulls,
-                clean_falsy=clean_falsy,
-                keep_falsy_numerics=keep_falsy_numerics,
-                inplace=True,
-            )
+            # Only nested iterables can be filtered further; scalar values are checked by the sanity pass below.
+            if isinstance(value, (dict, list, set, tuple)):
+                deep_filter_properties_iterable(
+                    properties=value,
+                    keep_fields=keep_fields,
+                    delete_fields=delete_fields,
+                    clean_nulls=clean_nulls,
+                    clean_falsy=clean_falsy,
+                    keep_falsy_numerics=keep_falsy_numerics,
+                    inplace=True,
+                )
 
         # Upon unwinding the call stack, do a sanity check to ensure cleaned properties.
         keys_to_delete: List[str] = list(
@@ -1350,15 +1353,16 @@ def deep_filter_properties_iterable(
             properties = copy.deepcopy(properties)
 
         for value in properties:
-            deep_filter_properties_iterable(
-                properties=value,
-                keep_fields=keep_fields,
-                delete_fields=delete_fields,
-                clean_nulls=clean_nulls,
-                clean_falsy=clean_falsy,
-                keep_falsy_numerics=keep_falsy_numerics,
-                inplace=True,
-            )
+            if isinstance(value, (dict, list, set, tuple)):
+                deep_filter_properties_iterable(
+                    properties=value,
+                    keep_fields=keep_fields,
+                    delete_fields=delete_fields,
+                    clean_nulls=clean_nulls,
+                    clean_falsy=clean_falsy,
+                    keep_falsy_numerics=keep_falsy_numerics,
+                    inplace=True,
+                )
 
         # Upon unwinding the call stack, do a sanity check to ensure cleaned properties.
         properties_type: type = type(properties)
@@ -1383,12 +1387,12 @@ def deep_filter_properties_iterable(
 def _is_to_be_removed_from_deep_filter_properties_iterable(
     value: Any, clean_nulls: bool, clean_falsy: bool, keep_falsy_numerics: bool
 ) -> bool:
-    conditions: Tuple[bool, ...] = (
-        clean_nulls and value is None,
-        not keep_falsy_numerics and is_numeric(value) and value == 0,
-        clean_falsy and not (is_numeric(value) or value),
+    # Conditions are evaluated lazily, in order, so that "is_numeric()" is only called when a directive requires it.
+    return bool(
+        (clean_nulls and value is None)
+        or (not keep_falsy_numerics and is_numeric(value) and value == 0)
+        or (clean_falsy and not (is_numeric(value) or value))
     )
-    return any(condition for condition in conditions)
 
 
 def is_truthy(value: Any) -> bool:
@@ -1918,7 +1922,10 @@ def pandas_series_between_inclusive(
 
 
 def numpy_quantile(
-    a: np.ndarray, q: float, method: str, axis: Optional[int] = None
+    a: np.ndarray,
+    q: Union[float, Sequence[float]],
+    method: str,
+    axis: Optional[int] = None,
 ) -> Union[np.float64, np.ndarray]:
     """
     As of NumPy 1.21.0, the 'interpolation' arg in quantile() has been renamed to `method`.
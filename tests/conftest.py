@@ -223,6 +223,11 @@ def pytest_addoption(parser):
     parser.addoption(
         "--cloud", action="store_true", help="If set, execute tests again GX Cloud"
     )
+    parser.addoption(
+        "--notebook-tests",
+        action="store_true",
+        help="If set, run tests that execute Jupyter notebooks in a new kernel",
+    )
     parser.addoption(
         "--performance-tests",
         action="store_true",
@@ -317,6 +322,11 @@ def pytest_collection_modifyitems(config, items):
             reason="need --docs-tests option to run",
         ),
         Category(mark="cloud", flag="--cloud", reason="need --cloud option to run"),
+        Category(
+            mark="notebook_execution",
+            flag="--notebook-tests",
+            reason="need --notebook-tests option to run",
+        ),
     )
 
     for category in categories:
@@ -6924,10 +6934,42 @@ def quentin_columnar_table_multi_batch():
     }
 
 
+@pytest.fixture(scope="session")
+def quentin_taxi_data_directory(tmp_path_factory) -> str:
+    """
+    Copies the 36 monthly taxi trip CSV files (one per batch) once per test session; the data is only ever read, so
+    every "quentin_columnar_table_multi_batch_data_context" shares this copy instead of making its own.
+    """
+    data_path: str = str(tmp_path_factory.mktemp("taxi_data"))
+    base_directory: str = file_relative_path(
+        __file__,
+        os.path.join(
+            "test_sets",
+            "taxi_yellow_tripdata_samples",
+        ),
+    )
+    file_name_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
+        base_directory_path=base_directory, glob_directive="*.csv"
+    )
+    file_name_list = sorted(file_name_list)
+
+    file_name: str
+    csv_source_path: str
+    for file_name in file_name_list:
+        csv_source_path = os.path.join(base_directory, file_name)
+        shutil.copy(
+            csv_source_path,
+            os.path.join(data_path, file_name),
+        )
+
+    return data_path
+
+
 @pytest.fixture
 def quentin_columnar_table_multi_batch_data_context(
     tmp_path_factory,
     monkeypatch,
+    quentin_taxi_data_directory: str,
 ) -> DataContext:
     """
     This fixture generates three years' worth (36 months; i.e., 36 batches) of taxi trip data with the number of rows
@@ -6940,8 +6982,13 @@ def quentin_columnar_table_multi_batch_data_context(
     project_path: str = str(tmp_path_factory.mktemp("taxi_data_context"))
     context_path: str = os.path.join(project_path, "great_expectations")
     os.makedirs(os.path.join(context_path, "expectations"), exist_ok=True)
-    data_path: str = os.path.join(context_path, "..", "data")
-    os.makedirs(os.path.join(data_path), exist_ok=True)
+    data_path: str = os.path.join(project_path, "data")
+    try:
+        os.symlink(quentin_taxi_data_directory, data_path, target_is_directory=True)
+    except OSError:
+        # Creating symbolic links may require elevated privileges (e.g., on Windows).
+        shutil.copytree(quentin_taxi_data_directory, data_path)
+
     shutil.copy(
         file_relative_path(
             __file__,
@@ -6955,26 +7002,6 @@ def quentin_columnar_table_multi_batch_data_context(
         ),
         str(os.path.join(context_path, "great_expectations.yml")),
     )
-    base_directory: str = file_relative_path(
-        __file__,
-        os.path.join(
-            "test_sets",
-            "taxi_yellow_tripdata_samples",
-        ),
-    )
-    file_name_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
-        base_directory_path=base_directory, glob_directive="*.csv"
-    )
-    file_name_list = sorted(file_name_list)
-
-    file_name: str
-    csv_source_path: str
-    for file_name in file_name_list:
-        csv_source_path = os.path.join(base_directory, file_name)
-        shutil.copy(
-            csv_source_path,
-            os.path.join(context_path, "..", "data", file_name),
-        )
 
     context = DataContext(context_root_dir=context_path)
     assert context.root_directory == context_path
@@ -6,6 +6,7 @@ import pandas as pd
 import pytest
 from dateutil.parser import parse
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
 from great_expectations.core.id_dict import BatchSpec
 from great_expectations.data_context.util import file_relative_path
@@ -354,3 +355,501 @@ def test_sample_using_random(sqlite_view_engine, test_df):
     assert len(rows_0) == len(rows_1)
 
     assert not (rows_0 == rows_1)
+
+
+def test_sample_using_random_uses_tablesample_for_postgresql(sa):
+    """What does this test and why?
+
+    If requested, dialects supporting row-level TABLESAMPLE should sample without counting or sorting the table.
+    """
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+
+        @property
+        def engine(self):
+            raise AssertionError("TABLESAMPLE sampling should not query the database.")
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": 0.25, "use_tablesample": True},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.true(),
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE bernoulli(25.0) WHERE true"
+    )
+
+    assert query_str == expected
+
+
+def test_sample_using_random_keeps_exact_sample_size_for_postgresql_by_default(sa):
+    """What does this test and why?
+
+    Without "use_tablesample", exactly round(p * number of rows) rows should be sampled on every dialect.
+    """
+
+    class MockResult:
+        @staticmethod
+        def scalar() -> int:
+            return 20
+
+    class MockEngine:
+        @staticmethod
+        def execute(query) -> MockResult:
+            return MockResult()
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+        engine = MockEngine()
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": 0.25},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.true(),
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "SELECT * FROM test_schema_name.test_table WHERE true ORDER BY random() LIMIT 5"
+    )
+
+    assert query_str == expected
+
+
+@pytest.mark.parametrize(
+    "p,expected_num_rows",
+    [
+        pytest.param(0.1, 1, id="0.5 rows"),
+        pytest.param(0.3, 2, id="1.5 rows"),
+        pytest.param(0.5, 3, id="2.5 rows"),
+        pytest.param(0.62, 3, id="3.1 rows"),
+    ],
+)
+def test_sqlite_sample_using_random_counts_rows_in_limit_subquery(
+    sa, p: float, expected_num_rows: int
+):
+    """What does this test and why?
+
+    On SQLite the sample size is counted in a LIMIT subquery, which must round p * number of rows half up,
+    exactly like the sample size computed in Python for other dialects.
+    """
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame({"a": range(5)}), sa
+    )
+
+    batch_spec = BatchSpec(
+        table_name="test",
+        schema_name="main",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": p},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=engine,
+        batch_spec=batch_spec,
+        where_clause=sa.text("1 = 1"),
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(query.compile(dialect=engine.dialect))
+    )
+    assert (
+        clean_query_for_comparison(
+            "LIMIT (SELECT CAST(? * count(*) + ? AS INTEGER) AS anon_1 FROM main.test WHERE 1 = 1)"
+        )
+        in query_str
+    )
+
+    rows: List[tuple] = engine.engine.execute(query).fetchall()
+    assert len(rows) == expected_num_rows
+
+
+@pytest.mark.parametrize(
+    "p,expected_sample_size",
+    [
+        pytest.param(0.1, 1, id="0.5 rows"),
+        pytest.param(0.3, 2, id="1.5 rows"),
+        pytest.param(0.5, 3, id="2.5 rows"),
+        pytest.param(0.62, 3, id="3.1 rows"),
+    ],
+)
+def test_sample_using_random_rounds_sample_size_half_up(
+    sa, p: float, expected_sample_size: int
+):
+    class MockResult:
+        @staticmethod
+        def scalar() -> int:
+            return 5
+
+    class MockEngine:
+        @staticmethod
+        def execute(query) -> MockResult:
+            return MockResult()
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+        engine = MockEngine()
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": p},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.true(),
+    )
+
+    assert query.compile().params["param_1"] == expected_sample_size
+
+
+def test_sample_using_md5_compares_hash_suffix_as_integer_for_postgresql(sa):
+    """What does this test and why?
+
+    Dialects able to convert hex strings to integers should compare the md5 suffix numerically.
+    """
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_md5",
+        sampling_kwargs={"column_name": "id", "hash_digits": 2, "hash_value": "ab"},
+    )
+    clause = SqlAlchemyDataSampler().sample_using_md5(
+        batch_spec=batch_spec,
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+    )
+
+    clause_str: str = clean_query_for_comparison(
+        str(
+            clause.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "CAST(CAST('x' || right(md5(CAST(id AS TEXT)), 8) AS BIT(32)) AS BIGINT) %% 256 = 171"
+    )
+
+    assert clause_str == expected
+
+
+@pytest.mark.parametrize(
+    "hash_digits,hash_value",
+    [
+        pytest.param(2, "AB", id="upper-case"),
+        pytest.param(2, "b", id="shorter than hash_digits"),
+        pytest.param(2, "0ab", id="longer than hash_digits"),
+        pytest.param(2, "xy", id="not hexadecimal"),
+    ],
+)
+def test_sample_using_md5_compares_non_canonical_hash_value_as_string(
+    sa, hash_digits: int, hash_value: str
+):
+    """What does this test and why?
+
+    A hash_value that no md5 suffix can equal must keep matching no rows, so it must not be parsed as an integer.
+    """
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_md5",
+        sampling_kwargs={
+            "column_name": "id",
+            "hash_digits": hash_digits,
+            "hash_value": hash_value,
+        },
+    )
+    clause = SqlAlchemyDataSampler().sample_using_md5(
+        batch_spec=batch_spec,
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+    )
+
+    clause_str: str = clean_query_for_comparison(
+        str(
+            clause.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        f"right(md5(CAST(id AS TEXT)), {hash_digits}) = '{hash_value}'"
+    )
+
+    assert clause_str == expected
+
+
+@pytest.mark.parametrize(
+    "use_native_hash",
+    [
+        pytest.param(False, id="md5"),
+        pytest.param(True, id="native hash"),
+    ],
+)
+def test_sample_using_md5_compares_as_string_for_more_than_eight_hash_digits(
+    sa, use_native_hash: bool
+):
+    """What does this test and why?
+
+    Only 32 bits of the hash are compared as an integer, so longer hash_value strings must be compared as strings.
+    """
+
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_md5",
+        sampling_kwargs={
+            "column_name": "id",
+            "hash_digits": 9,
+            "hash_value": "abcdef012",
+            "use_native_hash": use_native_hash,
+        },
+    )
+    clause = SqlAlchemyDataSampler().sample_using_md5(
+        batch_spec=batch_spec,
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+    )
+
+    clause_str: str = clean_query_for_comparison(
+        str(
+            clause.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "right(md5(CAST(id AS TEXT)), 9) = 'abcdef012'"
+    )
+
+    assert clause_str == expected
+
+
+@pytest.mark.parametrize(
+    "n,expected",
+    [
+        pytest.param(10, 10, id="int"),
+        pytest.param("10", 10, id="str"),
+        pytest.param(" 10 ", 10, id="whitespace wrapped str"),
+    ],
+)
+def test_validate_mssql_limit_param_returns_int(n, expected: int):
+    assert SqlAlchemyDataSampler._validate_mssql_limit_param(n) == expected
+
+
+@pytest.mark.parametrize(
+    "n",
+    [
+        pytest.param(10.5, id="float"),
+        pytest.param(None, id="None"),
+        pytest.param("ten", id="non-numeric str"),
+        pytest.param(-5, id="negative int"),
+        pytest.param("-5", id="negative str"),
+    ],
+)
+def test_validate_mssql_limit_param_raises_on_invalid_param(n):
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        SqlAlchemyDataSampler._validate_mssql_limit_param(n)
+
+
+def test_mssql_sample_using_limit_keeps_question_marks_in_literal_values(sa):
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.MSSQL.value
+        dialect = import_library_module(
+            module_name="sqlalchemy.dialects.mssql"
+        ).dialect()
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_limit",
+        sampling_kwargs={"n": 10},
+    )
+    query: str = SqlAlchemyDataSampler().sample_using_limit(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.column("a") == sa.literal("what?"),
+    )
+
+    assert clean_query_for_comparison(query) == clean_query_for_comparison(
+        "SELECT TOP 10 * FROM test_schema_name.test_table WHERE a = N'what?'"
+    )
+
+
+def test_sample_using_random_where_clause_none_keeps_all_rows(sa):
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.POSTGRESQL.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": 0.5, "use_tablesample": True},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=None,
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.postgresql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    assert query_str.endswith(clean_query_for_comparison("WHERE true"))
+
+
+def test_sample_using_md5_use_native_hash_for_mysql(sa):
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.MYSQL.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_md5",
+        sampling_kwargs={
+            "column_name": "id",
+            "hash_digits": 1,
+            "hash_value": "f",
+            "use_native_hash": True,
+        },
+    )
+    clause = SqlAlchemyDataSampler().sample_using_md5(
+        batch_spec=batch_spec,
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+    )
+
+    clause_str: str = clean_query_for_comparison(
+        str(
+            clause.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.mysql"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "mod(mod(crc32(CAST(id AS CHAR)), 16) + 16, 16) = 15"
+    )
+
+    assert clause_str == expected
+
+
+def test_oracle_sample_using_limit_returns_selectable(sa):
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.ORACLE.value
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_limit",
+        sampling_kwargs={"n": 10},
+    )
+    query = SqlAlchemyDataSampler().sample_using_limit(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.column("a") == 5,
+    )
+
+    assert isinstance(query, sa.sql.Selectable)
+    assert clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.oracle"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    ) == clean_query_for_comparison(
+        "SELECT * FROM test_schema_name.test_table WHERE a = 5 AND ROWNUM <= 10"
+    )
+
+
+def test_sample_using_random_p_one_selects_all_rows_without_querying(sa):
+    class MockSqlAlchemyExecutionEngine:
+        dialect_name: str = GESqlDialect.SQLITE.value
+
+        @property
+        def engine(self):
+            raise AssertionError("Sampling every row should not query the database.")
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_random",
+        sampling_kwargs={"p": 1.0},
+    )
+    query = SqlAlchemyDataSampler.sample_using_random(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sa.text("1 = 1"),
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name="sqlalchemy.dialects.sqlite"
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+    expected: str = clean_query_for_comparison(
+        "SELECT * FROM test_schema_name.test_table WHERE 1 = 1"
+    )
+
+    assert query_str == expected
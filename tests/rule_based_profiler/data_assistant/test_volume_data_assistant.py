@@ -1,3 +1,5 @@
+import functools
+import json
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 from unittest import mock
@@ -13,6 +15,7 @@ from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
+from great_expectations.data_context.util import file_relative_path
 from great_expectations.rule_based_profiler.altair import AltairDataTypes
 from great_expectations.rule_based_profiler.config import RuleBasedProfilerConfig
 from great_expectations.rule_based_profiler.data_assistant import VolumeDataAssistant
@@ -26,11 +29,7 @@ from great_expectations.rule_based_profiler.data_assistant_result import (
 from great_expectations.rule_based_profiler.data_assistant_result.plot_result import (
     PlotResult,
 )
-from great_expectations.rule_based_profiler.domain import (
-    INFERRED_SEMANTIC_TYPE_KEY,
-    Domain,
-    SemanticDomainTypes,
-)
+from great_expectations.rule_based_profiler.domain import Domain
 from great_expectations.rule_based_profiler.helpers.util import (
     get_validator_with_expectation_suite,
 )
@@ -40,902 +39,141 @@ from great_expectations.rule_based_profiler.parameter_container import (
 )
 from great_expectations.util import deep_filter_properties_iterable
 from great_expectations.validator.validator import Validator
-from tests.render.test_util import load_notebook_from_path
 from tests.test_utils import find_strings_in_nested_obj
 
+# Tests built on "quentin_columnar_table_multi_batch_data_context" are kept on one pytest-xdist worker, leaving the
+# notebook execution tests (dominated by kernel startup) free to run concurrently on other workers, e.g.:
+# pytest -n auto --dist loadgroup --notebook-tests tests/rule_based_profiler/data_assistant/test_volume_data_assistant.py
+QUENTIN_XDIST_GROUP: str = "volume_data_assistant"
+
+FROZEN_TIME: str = "09/26/2019 13:42:41"
+
+# The usage statistics client posts events through requests/urllib3 (and validates them with jsonschema); under a
+# frozen clock their connection and timeout bookkeeping stalls, so freezegun leaves these modules on real time.  No
+# timestamp under test comes from them; everything else, including pandas and great_expectations, stays frozen.
+# (freezegun extends the "ignore" list it is given in place, so every use passes a fresh list.)
+FREEZE_TIME_IGNORED_PACKAGES: Tuple[str, ...] = (
+    "jsonschema",
+    "requests",
+    "urllib3",
+)
 
-@pytest.fixture
+# Notebook cell sources are assembled once at import time rather than on every notebook test.
+VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE_INITIALIZATION: str = """
+from typing import Optional, Union
+
+import uuid
+
+import great_expectations as ge
+from great_expectations.data_context import BaseDataContext
+from great_expectations.validator.validator import Validator
+from great_expectations.rule_based_profiler.data_assistant import (
+    DataAssistant,
+    VolumeDataAssistant,
+)
+from great_expectations.rule_based_profiler.data_assistant_result import DataAssistantResult
+from great_expectations.rule_based_profiler.helpers.util import get_validator_with_expectation_suite
+import great_expectations.exceptions as ge_exceptions
+
+context = ge.get_context()
+
+batch_request: dict = {
+    "datasource_name": "taxi_pandas",
+    "data_connector_name": "monthly",
+    "data_asset_name": "my_reports",
+}
+
+"""
+
+EXPLICIT_VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE: str = (
+    VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE_INITIALIZATION
+    + """
+validator: Validator = get_validator_with_expectation_suite(
+    data_context=context,
+    batch_list=None,
+    batch_request=batch_request,
+    expectation_suite_name=None,
+    expectation_suite=None,
+    component_name="volume_data_assistant",
+    persist=False,
+)
+
+data_assistant = VolumeDataAssistant(
+    name="test_volume_data_assistant",
+    validator=validator,
+)
+
+data_assistant_result: DataAssistantResult = data_assistant.run()
+"""
+)
+
+IMPLICIT_VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE: str = (
+    VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE_INITIALIZATION
+    + """
+data_assistant_result: DataAssistantResult = context.assistants.volume.run(batch_request=batch_request)
+"""
+)
+
+
+def _build_attributed_value(
+    batch_ids: List[str], values: List[Any]
+) -> Dict[str, List[Any]]:
+    """
+    Attributes each metric value to the batch at the same position.  Batches with equal values share one
+    single-element list (the expected metrics are only compared against, never mutated).
+    """
+    value: Any
+    attributed_value_by_value: Dict[Any, List[Any]] = {
+        value: [value] for value in values
+    }
+    batch_id: str
+    return {
+        batch_id: attributed_value_by_value[value]
+        for batch_id, value in zip(batch_ids, values)
+    }
+
+
+@pytest.fixture(scope="module")
 def quentin_expected_metrics_by_domain() -> Dict[Domain, Dict[str, Any]]:
+    expected_metrics_by_domain_file_path: str = file_relative_path(
+        __file__,
+        os.path.join(
+            "..",
+            "..",
+            "test_fixtures",
+            "rule_based_profiler",
+            "quentin_volume_data_assistant_expected_metrics_by_domain.json",
+        ),
+    )
+
+    with open(expected_metrics_by_domain_file_path) as f:
+        expected_metrics_by_domain_file_contents: dict = json.load(f)
+
+    batch_ids: List[str] = expected_metrics_by_domain_file_contents["batch_ids"]
+
+    entry: dict
+    parameter_name: str
+    metric: dict
     expected_metrics_by_domain: Dict[Domain, Dict[str, Any]] = {
-        Domain(domain_type=MetricDomainTypes.TABLE, rule_name="table_rule",): {
-            "$parameter.table_row_count": {
-                "value": [
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                    10000,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [10000],
-                    "562969eaef9c843cb4531aecbc13bbcb": [10000],
-                    "569a4a80bf434c888593c651dbf2f157": [10000],
-                    "f6c389dcef63c1f214c30f66b66945c0": [10000],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [10000],
-                    "e20c38f98b9830a40b851939ca7189d4": [10000],
-                    "f2e4d3da6556638b55df8ce509b094c2": [10000],
-                    "44c1b1947c9049e7db62c5320dde4c63": [10000],
-                    "47157bdaf05a7992473cd699cabaef74": [10000],
-                    "08085632aff9ce4cebbb8023049e1aec": [10000],
-                    "bb54e4fa3906387218be10cff631a7c2": [10000],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [10000],
-                    "0327cfb13205ec8512e1c28e438ab43b": [10000],
-                    "0808e185a52825d22356de2fe00a8f5f": [10000],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [10000],
-                    "6c7e43619fe5e6963e8159cc84a28321": [10000],
-                    "976b121b46db6967854b9c1a6628396b": [10000],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [10000],
-                    "ce5f02ac408b7b5c500050190f549736": [10000],
-                    "bb81456ec79522bf02f34b02762f95e0": [10000],
-                    "b20800a7faafd2808d6c888577a2ba1d": [10000],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [10000],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [10000],
-                    "3692b23382fd4734215465251290c65b": [10000],
-                    "eff8910cddcdff62e4741243099240d5": [10000],
-                    "f67d274202366f6b976414c950ca14bd": [10000],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [10000],
-                    "73612fdabd337d5a8279acc30ce22d00": [10000],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [10000],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [10000],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [10000],
-                    "940576153c66af14a949fd19aedd5f5b": [10000],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [10000],
-                    "57c04d62ada3a102248b48f34c755159": [10000],
-                    "816b147dcf3305839f723a131b9ad6af": [10000],
-                    "84000630d1b69a0fe870c94fb26a32bc": [10000],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "table.row_count",
-                        "domain_kwargs": {},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "passenger_count",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "passenger_count": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    8,
-                    7,
-                    7,
-                    7,
-                    7,
-                    8,
-                    6,
-                    7,
-                    7,
-                    7,
-                    7,
-                    8,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    8,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                    7,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [7],
-                    "562969eaef9c843cb4531aecbc13bbcb": [7],
-                    "569a4a80bf434c888593c651dbf2f157": [7],
-                    "f6c389dcef63c1f214c30f66b66945c0": [7],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [7],
-                    "e20c38f98b9830a40b851939ca7189d4": [7],
-                    "f2e4d3da6556638b55df8ce509b094c2": [8],
-                    "44c1b1947c9049e7db62c5320dde4c63": [7],
-                    "47157bdaf05a7992473cd699cabaef74": [7],
-                    "08085632aff9ce4cebbb8023049e1aec": [7],
-                    "bb54e4fa3906387218be10cff631a7c2": [7],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [8],
-                    "0327cfb13205ec8512e1c28e438ab43b": [6],
-                    "0808e185a52825d22356de2fe00a8f5f": [7],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [7],
-                    "6c7e43619fe5e6963e8159cc84a28321": [7],
-                    "976b121b46db6967854b9c1a6628396b": [7],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [8],
-                    "ce5f02ac408b7b5c500050190f549736": [7],
-                    "bb81456ec79522bf02f34b02762f95e0": [7],
-                    "b20800a7faafd2808d6c888577a2ba1d": [7],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [7],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [7],
-                    "3692b23382fd4734215465251290c65b": [8],
-                    "eff8910cddcdff62e4741243099240d5": [7],
-                    "f67d274202366f6b976414c950ca14bd": [7],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [7],
-                    "73612fdabd337d5a8279acc30ce22d00": [7],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [7],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [7],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [7],
-                    "940576153c66af14a949fd19aedd5f5b": [7],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [7],
-                    "57c04d62ada3a102248b48f34c755159": [7],
-                    "816b147dcf3305839f723a131b9ad6af": [7],
-                    "84000630d1b69a0fe870c94fb26a32bc": [7],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "passenger_count"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "store_and_fwd_flag",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "store_and_fwd_flag": SemanticDomainTypes.TEXT,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                    2,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [2],
-                    "562969eaef9c843cb4531aecbc13bbcb": [2],
-                    "569a4a80bf434c888593c651dbf2f157": [2],
-                    "f6c389dcef63c1f214c30f66b66945c0": [2],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [2],
-                    "e20c38f98b9830a40b851939ca7189d4": [2],
-                    "f2e4d3da6556638b55df8ce509b094c2": [2],
-                    "44c1b1947c9049e7db62c5320dde4c63": [2],
-                    "47157bdaf05a7992473cd699cabaef74": [2],
-                    "08085632aff9ce4cebbb8023049e1aec": [2],
-                    "bb54e4fa3906387218be10cff631a7c2": [2],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [2],
-                    "0327cfb13205ec8512e1c28e438ab43b": [2],
-                    "0808e185a52825d22356de2fe00a8f5f": [2],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [2],
-                    "6c7e43619fe5e6963e8159cc84a28321": [2],
-                    "976b121b46db6967854b9c1a6628396b": [2],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [2],
-                    "ce5f02ac408b7b5c500050190f549736": [2],
-                    "bb81456ec79522bf02f34b02762f95e0": [2],
-                    "b20800a7faafd2808d6c888577a2ba1d": [2],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [2],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [2],
-                    "3692b23382fd4734215465251290c65b": [2],
-                    "eff8910cddcdff62e4741243099240d5": [2],
-                    "f67d274202366f6b976414c950ca14bd": [2],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [2],
-                    "73612fdabd337d5a8279acc30ce22d00": [2],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [2],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [2],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [2],
-                    "940576153c66af14a949fd19aedd5f5b": [2],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [2],
-                    "57c04d62ada3a102248b48f34c755159": [2],
-                    "816b147dcf3305839f723a131b9ad6af": [2],
-                    "84000630d1b69a0fe870c94fb26a32bc": [2],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "store_and_fwd_flag"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "payment_type",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "payment_type": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                    4,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [4],
-                    "562969eaef9c843cb4531aecbc13bbcb": [4],
-                    "569a4a80bf434c888593c651dbf2f157": [4],
-                    "f6c389dcef63c1f214c30f66b66945c0": [4],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [4],
-                    "e20c38f98b9830a40b851939ca7189d4": [4],
-                    "f2e4d3da6556638b55df8ce509b094c2": [4],
-                    "44c1b1947c9049e7db62c5320dde4c63": [4],
-                    "47157bdaf05a7992473cd699cabaef74": [4],
-                    "08085632aff9ce4cebbb8023049e1aec": [4],
-                    "bb54e4fa3906387218be10cff631a7c2": [4],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [4],
-                    "0327cfb13205ec8512e1c28e438ab43b": [4],
-                    "0808e185a52825d22356de2fe00a8f5f": [4],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [4],
-                    "6c7e43619fe5e6963e8159cc84a28321": [4],
-                    "976b121b46db6967854b9c1a6628396b": [4],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [4],
-                    "ce5f02ac408b7b5c500050190f549736": [4],
-                    "bb81456ec79522bf02f34b02762f95e0": [4],
-                    "b20800a7faafd2808d6c888577a2ba1d": [4],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [4],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [4],
-                    "3692b23382fd4734215465251290c65b": [4],
-                    "eff8910cddcdff62e4741243099240d5": [4],
-                    "f67d274202366f6b976414c950ca14bd": [4],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [4],
-                    "73612fdabd337d5a8279acc30ce22d00": [4],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [4],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [4],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [4],
-                    "940576153c66af14a949fd19aedd5f5b": [4],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [4],
-                    "57c04d62ada3a102248b48f34c755159": [4],
-                    "816b147dcf3305839f723a131b9ad6af": [4],
-                    "84000630d1b69a0fe870c94fb26a32bc": [4],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "payment_type"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "extra",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "extra": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    6,
-                    6,
-                    6,
-                    5,
-                    6,
-                    4,
-                    5,
-                    7,
-                    6,
-                    7,
-                    6,
-                    6,
-                    8,
-                    10,
-                    12,
-                    12,
-                    10,
-                    11,
-                    12,
-                    14,
-                    13,
-                    16,
-                    12,
-                    13,
-                    12,
-                    15,
-                    14,
-                    10,
-                    11,
-                    10,
-                    13,
-                    12,
-                    11,
-                    10,
-                    11,
-                    10,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [6],
-                    "562969eaef9c843cb4531aecbc13bbcb": [6],
-                    "569a4a80bf434c888593c651dbf2f157": [6],
-                    "f6c389dcef63c1f214c30f66b66945c0": [5],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [6],
-                    "e20c38f98b9830a40b851939ca7189d4": [4],
-                    "f2e4d3da6556638b55df8ce509b094c2": [5],
-                    "44c1b1947c9049e7db62c5320dde4c63": [7],
-                    "47157bdaf05a7992473cd699cabaef74": [6],
-                    "08085632aff9ce4cebbb8023049e1aec": [7],
-                    "bb54e4fa3906387218be10cff631a7c2": [6],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [6],
-                    "0327cfb13205ec8512e1c28e438ab43b": [8],
-                    "0808e185a52825d22356de2fe00a8f5f": [10],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [12],
-                    "6c7e43619fe5e6963e8159cc84a28321": [12],
-                    "976b121b46db6967854b9c1a6628396b": [10],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [11],
-                    "ce5f02ac408b7b5c500050190f549736": [12],
-                    "bb81456ec79522bf02f34b02762f95e0": [14],
-                    "b20800a7faafd2808d6c888577a2ba1d": [13],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [16],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [12],
-                    "3692b23382fd4734215465251290c65b": [13],
-                    "eff8910cddcdff62e4741243099240d5": [12],
-                    "f67d274202366f6b976414c950ca14bd": [15],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [14],
-                    "73612fdabd337d5a8279acc30ce22d00": [10],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [11],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [10],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [13],
-                    "940576153c66af14a949fd19aedd5f5b": [12],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [11],
-                    "57c04d62ada3a102248b48f34c755159": [10],
-                    "816b147dcf3305839f723a131b9ad6af": [11],
-                    "84000630d1b69a0fe870c94fb26a32bc": [10],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "extra"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "mta_tax",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "mta_tax": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    4,
-                    3,
-                    3,
-                    3,
-                    3,
-                    4,
-                    3,
-                    3,
-                    3,
-                    3,
-                    4,
-                    4,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    4,
-                    4,
-                    3,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [3],
-                    "562969eaef9c843cb4531aecbc13bbcb": [3],
-                    "569a4a80bf434c888593c651dbf2f157": [3],
-                    "f6c389dcef63c1f214c30f66b66945c0": [3],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [3],
-                    "e20c38f98b9830a40b851939ca7189d4": [3],
-                    "f2e4d3da6556638b55df8ce509b094c2": [3],
-                    "44c1b1947c9049e7db62c5320dde4c63": [3],
-                    "47157bdaf05a7992473cd699cabaef74": [3],
-                    "08085632aff9ce4cebbb8023049e1aec": [3],
-                    "bb54e4fa3906387218be10cff631a7c2": [3],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [3],
-                    "0327cfb13205ec8512e1c28e438ab43b": [4],
-                    "0808e185a52825d22356de2fe00a8f5f": [3],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [3],
-                    "6c7e43619fe5e6963e8159cc84a28321": [3],
-                    "976b121b46db6967854b9c1a6628396b": [3],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [4],
-                    "ce5f02ac408b7b5c500050190f549736": [3],
-                    "bb81456ec79522bf02f34b02762f95e0": [3],
-                    "b20800a7faafd2808d6c888577a2ba1d": [3],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [3],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [4],
-                    "3692b23382fd4734215465251290c65b": [4],
-                    "eff8910cddcdff62e4741243099240d5": [3],
-                    "f67d274202366f6b976414c950ca14bd": [3],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [3],
-                    "73612fdabd337d5a8279acc30ce22d00": [3],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [3],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [3],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [3],
-                    "940576153c66af14a949fd19aedd5f5b": [3],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [3],
-                    "57c04d62ada3a102248b48f34c755159": [4],
-                    "816b147dcf3305839f723a131b9ad6af": [4],
-                    "84000630d1b69a0fe870c94fb26a32bc": [3],
-                },
+        Domain(**entry["domain"]): {
+            parameter_name: {
+                "value": metric["value"],
+                "attributed_value": _build_attributed_value(
+                    batch_ids=batch_ids, values=metric["value"]
+                ),
                 "details": {
                     "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "mta_tax"},
+                        "metric_name": metric["metric_name"],
+                        "domain_kwargs": entry["domain"].get("domain_kwargs", {}),
                         "metric_value_kwargs": None,
                         "metric_dependencies": None,
                     },
-                    "num_batches": 36,
+                    "num_batches": len(batch_ids),
                 },
             }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "tolls_amount",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "tolls_amount": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    20,
-                    24,
-                    28,
-                    24,
-                    21,
-                    25,
-                    23,
-                    26,
-                    24,
-                    19,
-                    24,
-                    26,
-                    22,
-                    26,
-                    20,
-                    27,
-                    27,
-                    23,
-                    31,
-                    27,
-                    28,
-                    32,
-                    23,
-                    26,
-                    27,
-                    29,
-                    20,
-                    19,
-                    22,
-                    30,
-                    27,
-                    22,
-                    21,
-                    22,
-                    16,
-                    20,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [20],
-                    "562969eaef9c843cb4531aecbc13bbcb": [24],
-                    "569a4a80bf434c888593c651dbf2f157": [28],
-                    "f6c389dcef63c1f214c30f66b66945c0": [24],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [21],
-                    "e20c38f98b9830a40b851939ca7189d4": [25],
-                    "f2e4d3da6556638b55df8ce509b094c2": [23],
-                    "44c1b1947c9049e7db62c5320dde4c63": [26],
-                    "47157bdaf05a7992473cd699cabaef74": [24],
-                    "08085632aff9ce4cebbb8023049e1aec": [19],
-                    "bb54e4fa3906387218be10cff631a7c2": [24],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [26],
-                    "0327cfb13205ec8512e1c28e438ab43b": [22],
-                    "0808e185a52825d22356de2fe00a8f5f": [26],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [20],
-                    "6c7e43619fe5e6963e8159cc84a28321": [27],
-                    "976b121b46db6967854b9c1a6628396b": [27],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [23],
-                    "ce5f02ac408b7b5c500050190f549736": [31],
-                    "bb81456ec79522bf02f34b02762f95e0": [27],
-                    "b20800a7faafd2808d6c888577a2ba1d": [28],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [32],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [23],
-                    "3692b23382fd4734215465251290c65b": [26],
-                    "eff8910cddcdff62e4741243099240d5": [27],
-                    "f67d274202366f6b976414c950ca14bd": [29],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [20],
-                    "73612fdabd337d5a8279acc30ce22d00": [19],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [22],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [30],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [27],
-                    "940576153c66af14a949fd19aedd5f5b": [22],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [21],
-                    "57c04d62ada3a102248b48f34c755159": [22],
-                    "816b147dcf3305839f723a131b9ad6af": [16],
-                    "84000630d1b69a0fe870c94fb26a32bc": [20],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "tolls_amount"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "improvement_surcharge",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "improvement_surcharge": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [3],
-                    "562969eaef9c843cb4531aecbc13bbcb": [3],
-                    "569a4a80bf434c888593c651dbf2f157": [3],
-                    "f6c389dcef63c1f214c30f66b66945c0": [3],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [3],
-                    "e20c38f98b9830a40b851939ca7189d4": [3],
-                    "f2e4d3da6556638b55df8ce509b094c2": [3],
-                    "44c1b1947c9049e7db62c5320dde4c63": [3],
-                    "47157bdaf05a7992473cd699cabaef74": [3],
-                    "08085632aff9ce4cebbb8023049e1aec": [3],
-                    "bb54e4fa3906387218be10cff631a7c2": [3],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [3],
-                    "0327cfb13205ec8512e1c28e438ab43b": [3],
-                    "0808e185a52825d22356de2fe00a8f5f": [3],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [3],
-                    "6c7e43619fe5e6963e8159cc84a28321": [3],
-                    "976b121b46db6967854b9c1a6628396b": [3],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [3],
-                    "ce5f02ac408b7b5c500050190f549736": [3],
-                    "bb81456ec79522bf02f34b02762f95e0": [3],
-                    "b20800a7faafd2808d6c888577a2ba1d": [3],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [3],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [3],
-                    "3692b23382fd4734215465251290c65b": [3],
-                    "eff8910cddcdff62e4741243099240d5": [3],
-                    "f67d274202366f6b976414c950ca14bd": [3],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [3],
-                    "73612fdabd337d5a8279acc30ce22d00": [3],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [3],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [3],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [3],
-                    "940576153c66af14a949fd19aedd5f5b": [3],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [3],
-                    "57c04d62ada3a102248b48f34c755159": [3],
-                    "816b147dcf3305839f723a131b9ad6af": [3],
-                    "84000630d1b69a0fe870c94fb26a32bc": [3],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "improvement_surcharge"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
-        Domain(
-            domain_type=MetricDomainTypes.COLUMN,
-            domain_kwargs={
-                "column": "congestion_surcharge",
-            },
-            details={
-                INFERRED_SEMANTIC_TYPE_KEY: {
-                    "congestion_surcharge": SemanticDomainTypes.NUMERIC,
-                },
-            },
-            rule_name="categorical_columns_rule",
-        ): {
-            "$parameter.column_distinct_values_count": {
-                "value": [
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    1,
-                    3,
-                    3,
-                    4,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    4,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                    3,
-                ],
-                "attributed_value": {
-                    "c92d0679f769ac83fef2bb5eaac5d12a": [0],
-                    "562969eaef9c843cb4531aecbc13bbcb": [0],
-                    "569a4a80bf434c888593c651dbf2f157": [0],
-                    "f6c389dcef63c1f214c30f66b66945c0": [0],
-                    "c4fe9afce1cf3e83eb8518a9f5abc754": [0],
-                    "e20c38f98b9830a40b851939ca7189d4": [0],
-                    "f2e4d3da6556638b55df8ce509b094c2": [0],
-                    "44c1b1947c9049e7db62c5320dde4c63": [0],
-                    "47157bdaf05a7992473cd699cabaef74": [0],
-                    "08085632aff9ce4cebbb8023049e1aec": [0],
-                    "bb54e4fa3906387218be10cff631a7c2": [0],
-                    "58ce3b40d384eacd9bad7d916eb8f705": [0],
-                    "0327cfb13205ec8512e1c28e438ab43b": [1],
-                    "0808e185a52825d22356de2fe00a8f5f": [3],
-                    "90bb41c1fbd7c71c05dbc8695320af71": [3],
-                    "6c7e43619fe5e6963e8159cc84a28321": [4],
-                    "976b121b46db6967854b9c1a6628396b": [3],
-                    "9e58d3c72c7006b6f5800b623fbc9818": [3],
-                    "ce5f02ac408b7b5c500050190f549736": [3],
-                    "bb81456ec79522bf02f34b02762f95e0": [3],
-                    "b20800a7faafd2808d6c888577a2ba1d": [3],
-                    "33d910f95326c0c7dfe7536d1cfeba51": [3],
-                    "61e4931d87cb627df2a19b8bc5819b7b": [3],
-                    "3692b23382fd4734215465251290c65b": [3],
-                    "eff8910cddcdff62e4741243099240d5": [4],
-                    "f67d274202366f6b976414c950ca14bd": [3],
-                    "7b3ce20a8e8cf3097bb9df270a7ae63a": [3],
-                    "73612fdabd337d5a8279acc30ce22d00": [3],
-                    "ad2ad2a70c3e0bf94ddef3f893e92291": [3],
-                    "8ce0d477f610ea18e2ea4fbbb46de857": [3],
-                    "ff5a6cc031dd2c98b8bccd4766af38c1": [3],
-                    "940576153c66af14a949fd19aedd5f5b": [3],
-                    "ab05b4fb82e37c8cf5b1ac40d0a37fe9": [3],
-                    "57c04d62ada3a102248b48f34c755159": [3],
-                    "816b147dcf3305839f723a131b9ad6af": [3],
-                    "84000630d1b69a0fe870c94fb26a32bc": [3],
-                },
-                "details": {
-                    "metric_configuration": {
-                        "metric_name": "column.distinct_values.count",
-                        "domain_kwargs": {"column": "congestion_surcharge"},
-                        "metric_value_kwargs": None,
-                        "metric_dependencies": None,
-                    },
-                    "num_batches": 36,
-                },
-            }
-        },
+            for parameter_name, metric in entry["metrics"].items()
+        }
+        for entry in expected_metrics_by_domain_file_contents["metrics_by_domain"]
     }
     return expected_metrics_by_domain
 
@@ -1139,219 +377,71 @@ def quentin_expected_rule_based_profiler_configuration() -> Callable:
     return _profiler_config
 
 
+# (column, min_value, max_value) of every "expect_column_unique_value_count_to_be_between" expectation, in suite order.
+QUENTIN_EXPECTED_COLUMN_UNIQUE_VALUE_COUNT_BOUNDS: List[Tuple[str, int, int]] = [
+    ("passenger_count", 7, 8),
+    ("store_and_fwd_flag", 2, 2),
+    ("payment_type", 4, 4),
+    ("extra", 5, 15),
+    ("mta_tax", 3, 4),
+    ("tolls_amount", 18, 31),
+    ("improvement_surcharge", 3, 3),
+    ("congestion_surcharge", 0, 4),
+]
+
+
 @pytest.fixture
 def quentin_expected_expectation_suite(
     quentin_expected_rule_based_profiler_configuration,
 ) -> Callable:
     def _expectation_suite(name: str) -> ExpectationSuite:
         expected_expect_table_row_count_to_be_between_expectation_configuration: ExpectationConfiguration = ExpectationConfiguration(
-            **{
-                "expectation_type": "expect_table_row_count_to_be_between",
-                "kwargs": {
-                    "min_value": 10000,
-                    "max_value": 10000,
-                },
-                "meta": {
-                    "profiler_details": {
-                        "metric_configuration": {
-                            "metric_name": "table.row_count",
-                            "domain_kwargs": {},
-                            "metric_value_kwargs": None,
-                            "metric_dependencies": None,
-                        },
-                        "num_batches": 36,
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={
+                "min_value": 10000,
+                "max_value": 10000,
+            },
+            meta={
+                "profiler_details": {
+                    "metric_configuration": {
+                        "metric_name": "table.row_count",
+                        "domain_kwargs": {},
+                        "metric_value_kwargs": None,
+                        "metric_dependencies": None,
                     },
+                    "num_batches": 36,
                 },
             },
         )
 
+        column_name: str
+        min_value: int
+        max_value: int
         expected_expect_column_unique_value_count_to_be_between_expectation_configuration_list: List[
             ExpectationConfiguration
         ] = [
             ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "passenger_count"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 8,
-                        "strict_min": False,
-                        "column": "passenger_count",
-                        "min_value": 7,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "store_and_fwd_flag"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 2,
-                        "strict_min": False,
-                        "column": "store_and_fwd_flag",
-                        "min_value": 2,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "payment_type"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 4,
-                        "strict_min": False,
-                        "column": "payment_type",
-                        "min_value": 4,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "extra"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 15,
-                        "strict_min": False,
-                        "column": "extra",
-                        "min_value": 5,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "mta_tax"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 4,
-                        "strict_min": False,
-                        "column": "mta_tax",
-                        "min_value": 3,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "tolls_amount"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 31,
-                        "strict_min": False,
-                        "column": "tolls_amount",
-                        "min_value": 18,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "improvement_surcharge"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 3,
-                        "strict_min": False,
-                        "column": "improvement_surcharge",
-                        "min_value": 3,
-                    },
-                }
-            ),
-            ExpectationConfiguration(
-                **{
-                    "meta": {
-                        "profiler_details": {
-                            "metric_configuration": {
-                                "metric_name": "column.distinct_values.count",
-                                "domain_kwargs": {"column": "congestion_surcharge"},
-                                "metric_value_kwargs": None,
-                                "metric_dependencies": None,
-                            },
-                            "num_batches": 36,
-                        }
-                    },
-                    "expectation_type": "expect_column_unique_value_count_to_be_between",
-                    "kwargs": {
-                        "strict_max": False,
-                        "max_value": 4,
-                        "strict_min": False,
-                        "column": "congestion_surcharge",
-                        "min_value": 0,
-                    },
-                }
-            ),
+                expectation_type="expect_column_unique_value_count_to_be_between",
+                kwargs={
+                    "strict_max": False,
+                    "max_value": max_value,
+                    "strict_min": False,
+                    "column": column_name,
+                    "min_value": min_value,
+                },
+                meta={
+                    "profiler_details": {
+                        "metric_configuration": {
+                            "metric_name": "column.distinct_values.count",
+                            "domain_kwargs": {"column": column_name},
+                            "metric_value_kwargs": None,
+                            "metric_dependencies": None,
+                        },
+                        "num_batches": 36,
+                    }
+                },
+            )
+            for column_name, min_value, max_value in QUENTIN_EXPECTED_COLUMN_UNIQUE_VALUE_COUNT_BOUNDS
         ]
 
         expected_expectation_configurations: List[ExpectationConfiguration] = (
@@ -1363,17 +453,13 @@ def quentin_expected_expectation_suite(
 
         expectation_suite_name: str = "my_suite"
 
+        # Every expected "ExpectationConfiguration" has a distinct domain, so they are passed to the constructor as is,
+        # rather than being matched one at a time against those already added (as "_add_expectation()" would do).
         expected_expectation_suite = ExpectationSuite(
             expectation_suite_name=expectation_suite_name,
+            expectations=expected_expectation_configurations,
         )
 
-        expectation_configuration: ExpectationConfiguration
-        for expectation_configuration in expected_expectation_configurations:
-            expected_expectation_suite._add_expectation(
-                expectation_configuration=expectation_configuration,
-                send_usage_event=False,
-            )
-
         expected_expectation_suite_meta: Dict[str, Any] = {
             "citations": [
                 {
@@ -1470,7 +556,7 @@ def quentin_explicit_instantiation_result_actual_time(
 
 
 @pytest.fixture
-@freeze_time("09/26/2019 13:42:41")
+@freeze_time(FROZEN_TIME, ignore=list(FREEZE_TIME_IGNORED_PACKAGES))
 def quentin_explicit_instantiation_result_frozen_time(
     quentin_columnar_table_multi_batch_data_context,
     set_consistent_seed_within_numeric_metric_range_multi_batch_parameter_builder,
@@ -1528,7 +614,7 @@ def quentin_implicit_invocation_result_actual_time(
 
 
 @pytest.fixture
-@freeze_time("09/26/2019 13:42:41")
+@freeze_time(FROZEN_TIME, ignore=list(FREEZE_TIME_IGNORED_PACKAGES))
 def quentin_implicit_invocation_result_frozen_time(
     quentin_columnar_table_multi_batch_data_context,
     set_consistent_seed_within_numeric_metric_range_multi_batch_parameter_builder,
@@ -1549,21 +635,37 @@ def quentin_implicit_invocation_result_frozen_time(
     return cast(VolumeDataAssistantResult, data_assistant_result)
 
 
+@pytest.fixture(scope="session")
+def notebook_execute_preprocessor() -> nbconvert.preprocessors.ExecutePreprocessor:
+    return nbconvert.preprocessors.ExecutePreprocessor(
+        timeout=180, kernel_name="python3"
+    )
+
+
+@pytest.fixture
+def volume_data_assistant_notebook_runner(
+    notebook_execute_preprocessor: nbconvert.preprocessors.ExecutePreprocessor,
+) -> Callable:
+    return functools.partial(
+        run_volume_data_assistant_result_jupyter_notebook_with_new_cell,
+        execute_preprocessor=notebook_execute_preprocessor,
+    )
+
+
 def run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
     context: DataContext,
     new_cell: str,
     implicit: bool,
+    execute_preprocessor: Optional[nbconvert.preprocessors.ExecutePreprocessor] = None,
 ):
     """
     To set this test up we:
     - create a suite
     - write code (as a string) for creating a VolumeDataAssistantResult
     - add a new cell to the notebook that was passed to this method
-    - write both cells to ipynb file
 
     We then:
-    - load the notebook back from disk
-    - execute the notebook (Note: this will raise various errors like
+    - execute the in-memory notebook (Note: this will raise various errors like
       CellExecutionError if any cell in the notebook fails)
     """
     root_dir: str = context.root_directory
@@ -1573,81 +675,24 @@ def run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
         expectation_suite_name=expectation_suite_name, overwrite_existing=True
     )
 
-    notebook_path: str = os.path.join(root_dir, f"run_volume_data_assistant.ipynb")
-
-    notebook_code_initialization: str = """
-    from typing import Optional, Union
-
-    import uuid
-
-    import great_expectations as ge
-    from great_expectations.data_context import BaseDataContext
-    from great_expectations.validator.validator import Validator
-    from great_expectations.rule_based_profiler.data_assistant import (
-        DataAssistant,
-        VolumeDataAssistant,
-    )
-    from great_expectations.rule_based_profiler.data_assistant_result import DataAssistantResult
-    from great_expectations.rule_based_profiler.helpers.util import get_validator_with_expectation_suite
-    import great_expectations.exceptions as ge_exceptions
-
-    context = ge.get_context()
-
-    batch_request: dict = {
-        "datasource_name": "taxi_pandas",
-        "data_connector_name": "monthly",
-        "data_asset_name": "my_reports",
-    }
-
-    """
-
-    explicit_instantiation_code: str = """
-    validator: Validator = get_validator_with_expectation_suite(
-        data_context=context,
-        batch_list=None,
-        batch_request=batch_request,
-        expectation_suite_name=None,
-        expectation_suite=None,
-        component_name="volume_data_assistant",
-        persist=False,
-    )
-
-    data_assistant = VolumeDataAssistant(
-        name="test_volume_data_assistant",
-        validator=validator,
+    notebook_code: str = (
+        IMPLICIT_VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE
+        if implicit
+        else EXPLICIT_VOLUME_DATA_ASSISTANT_NOTEBOOK_CODE
     )
 
-    data_assistant_result: DataAssistantResult = data_assistant.run()
-    """
-
-    implicit_invocation_code: str = """
-    data_assistant_result: DataAssistantResult = context.assistants.volume.run(batch_request=batch_request)
-    """
-
-    notebook_code: str
-    if implicit:
-        notebook_code = notebook_code_initialization + implicit_invocation_code
-    else:
-        notebook_code = notebook_code_initialization + explicit_instantiation_code
-
-    nb = nbformat.v4.new_notebook()
+    nb: nbformat.notebooknode.NotebookNode = nbformat.v4.new_notebook()
     nb["cells"] = []
     nb["cells"].append(nbformat.v4.new_code_cell(notebook_code))
     nb["cells"].append(nbformat.v4.new_code_cell(new_cell))
 
-    # Write notebook to path and load it as NotebookNode
-    with open(notebook_path, "w") as f:
-        nbformat.write(nb, f)
-
-    nb: nbformat.notebooknode.NotebookNode = load_notebook_from_path(
-        notebook_path=notebook_path
-    )
-
     # Run notebook
-    ep: nbconvert.preprocessors.ExecutePreprocessor = (
-        nbconvert.preprocessors.ExecutePreprocessor(timeout=180, kernel_name="python3")
-    )
-    ep.preprocess(nb, {"metadata": {"path": root_dir}})
+    if execute_preprocessor is None:
+        execute_preprocessor = nbconvert.preprocessors.ExecutePreprocessor(
+            timeout=180, kernel_name="python3"
+        )
+
+    execute_preprocessor.preprocess(nb, {"metadata": {"path": root_dir}})
 
 
 @pytest.mark.integration
@@ -1725,6 +770,7 @@ def test_volume_data_assistant_result_batch_id_to_batch_identifier_display_name_
 
 @pytest.mark.integration
 @pytest.mark.slow  # 3.72s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_get_metrics_and_expectations_using_explicit_instantiation(
     quentin_explicit_instantiation_result_frozen_time,
     quentin_expected_metrics_by_domain,
@@ -1791,9 +837,10 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_explicit_insta
     assert actual_expectation_suite == expected_expectation_suite
 
 
-@freeze_time("09/26/2019 13:42:41")
+@freeze_time(FROZEN_TIME, ignore=list(FREEZE_TIME_IGNORED_PACKAGES))
 @pytest.mark.integration
 @pytest.mark.slow  # 3.53s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invocation(
     quentin_implicit_invocation_result_frozen_time,
     quentin_expected_metrics_by_domain,
@@ -1873,9 +920,10 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invoc
     assert actual_expectation_suite == expected_expectation_suite
 
 
-@freeze_time("09/26/2019 13:42:41")
+@freeze_time(FROZEN_TIME, ignore=list(FREEZE_TIME_IGNORED_PACKAGES))
 @pytest.mark.integration
 @pytest.mark.slow  # 3.03s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invocation_with_domain_type_directives(
     quentin_columnar_table_multi_batch_data_context,
     set_consistent_seed_within_numeric_metric_range_multi_batch_parameter_builder,
@@ -1914,18 +962,21 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invoc
         for column_name in exclude_column_names
     ]
 
+    domain: Domain
     domain_key: Domain
-
-    # noinspection PyTypeChecker
-    quentin_expected_metrics_by_domain = dict(
-        filter(
-            lambda element: not any(
-                element[0].is_superset(other=domain_key)
-                for domain_key in expected_excluded_domains
-            ),
-            quentin_expected_metrics_by_domain.items(),
+    excluded_domains: List[Domain] = [
+        domain
+        for domain in quentin_expected_metrics_by_domain
+        if any(
+            domain.is_superset(other=domain_key)
+            for domain_key in expected_excluded_domains
         )
-    )
+    ]
+
+    # Copying a dictionary reuses the stored hashes of its "Domain" keys; only the excluded keys are hashed again.
+    quentin_expected_metrics_by_domain = dict(quentin_expected_metrics_by_domain)
+    for domain in excluded_domains:
+        del quentin_expected_metrics_by_domain[domain]
 
     registered_data_assistant_name: str = "volume_data_assistant"
 
@@ -2021,9 +1072,10 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invoc
     assert actual_expectation_suite == expected_expectation_suite
 
 
-@freeze_time("09/26/2019 13:42:41")
+@freeze_time(FROZEN_TIME, ignore=list(FREEZE_TIME_IGNORED_PACKAGES))
 @pytest.mark.integration
 @pytest.mark.slow  # 3.30s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invocation_with_estimation_directive(
     quentin_columnar_table_multi_batch_data_context,
 ):
@@ -2052,6 +1104,7 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invoc
 
 @pytest.mark.integration
 @pytest.mark.slow  # 3.31s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invocation_with_variables_directives(
     quentin_columnar_table_multi_batch_data_context,
 ):
@@ -2080,6 +1133,7 @@ def test_volume_data_assistant_get_metrics_and_expectations_using_implicit_invoc
 
 @pytest.mark.integration
 @pytest.mark.slow  # 4.97s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_execution_time_within_proper_bounds_using_explicit_instantiation(
     quentin_explicit_instantiation_result_actual_time,
 ):
@@ -2093,6 +1147,7 @@ def test_volume_data_assistant_execution_time_within_proper_bounds_using_explici
 
 @pytest.mark.integration
 @pytest.mark.slow  # 3.37s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_execution_time_within_proper_bounds_using_implicit_invocation(
     quentin_implicit_invocation_result_actual_time,
 ):
@@ -2106,6 +1161,7 @@ def test_volume_data_assistant_execution_time_within_proper_bounds_using_implici
 
 @pytest.mark.integration
 @pytest.mark.slow  # 3.46s
+@pytest.mark.xdist_group(QUENTIN_XDIST_GROUP)
 def test_volume_data_assistant_batch_id_order_consistency_in_attributed_metrics_by_domain_using_explicit_instantiation(
     quentin_explicit_instantiation_result_actual_time,
 ):
@@ -2132,8 +1188,10 @@ def test_volume_data_assistant_batch_id_order_consistency_in_attributed_metrics_
 
 @pytest.mark.integration
 @pytest.mark.slow  # 13.77s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_plot_descriptive_notebook_execution_fails(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
@@ -2142,14 +1200,14 @@ def test_volume_data_assistant_plot_descriptive_notebook_execution_fails(
     )
 
     with pytest.raises(nbconvert.preprocessors.CellExecutionError):
-        run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+        volume_data_assistant_notebook_runner(
             context=context,
             new_cell=new_cell,
             implicit=False,
         )
 
     with pytest.raises(nbconvert.preprocessors.CellExecutionError):
-        run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+        volume_data_assistant_notebook_runner(
             context=context,
             new_cell=new_cell,
             implicit=True,
@@ -2158,20 +1216,22 @@ def test_volume_data_assistant_plot_descriptive_notebook_execution_fails(
 
 @pytest.mark.integration
 @pytest.mark.slow  # 11.07s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_plot_descriptive_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
     new_cell: str = "data_assistant_result.plot_metrics()"
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,
@@ -2180,20 +1240,22 @@ def test_volume_data_assistant_plot_descriptive_notebook_execution(
 
 @pytest.mark.integration
 @pytest.mark.slow  # 11.91s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_plot_prescriptive_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
     new_cell: str = "data_assistant_result.plot_expectations_and_metrics()"
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,
@@ -2202,8 +1264,10 @@ def test_volume_data_assistant_plot_prescriptive_notebook_execution(
 
 @pytest.mark.integration
 @pytest.mark.slow  # 11.57s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_plot_descriptive_theme_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
@@ -2211,13 +1275,13 @@ def test_volume_data_assistant_plot_descriptive_theme_notebook_execution(
 
     new_cell: str = f"data_assistant_result.plot_metrics(theme={theme})"
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,
@@ -2226,8 +1290,10 @@ def test_volume_data_assistant_plot_descriptive_theme_notebook_execution(
 
 @pytest.mark.integration
 @pytest.mark.slow  # 12.09s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_plot_prescriptive_theme_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
@@ -2237,19 +1303,61 @@ def test_volume_data_assistant_plot_prescriptive_theme_notebook_execution(
         f"data_assistant_result.plot_expectations_and_metrics(theme={theme})"
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,
     )
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "plot_method_name",
+    [
+        "plot_metrics",
+        "plot_expectations_and_metrics",
+    ],
+)
+@pytest.mark.parametrize(
+    "plot_kwargs",
+    [
+        {},
+        {"theme": {"font": "Comic Sans MS"}},
+        {"sequential": False},
+    ],
+)
+def test_volume_data_assistant_plot_in_process_execution(
+    bobby_volume_data_assistant_result: VolumeDataAssistantResult,
+    plot_method_name: str,
+    plot_kwargs: dict,
+) -> None:
+    """
+    In-process counterpart of the "*_notebook_execution" tests (which only run with "--notebook-tests"), exercising
+    the same plotting calls against the shared "bobby_volume_data_assistant_result" without a Jupyter kernel.
+    """
+    plot_result: PlotResult = getattr(
+        bobby_volume_data_assistant_result, plot_method_name
+    )(**plot_kwargs)
+
+    assert len(plot_result.charts) > 0
+
+
+@pytest.mark.integration
+def test_volume_data_assistant_plot_in_process_execution_fails(
+    bobby_volume_data_assistant_result: VolumeDataAssistantResult,
+) -> None:
+    with pytest.raises(TypeError):
+        bobby_volume_data_assistant_result.plot_metrics(
+            this_is_not_a_real_parameter=True
+        )
+
+
 @pytest.mark.integration
 def test_volume_data_assistant_plot_returns_proper_dict_repr_of_table_domain_chart(
     bobby_volume_data_assistant_result: VolumeDataAssistantResult,
@@ -2470,20 +1578,22 @@ def test_volume_data_assistant_plot_return_tooltip(
 
 @pytest.mark.integration
 @pytest.mark.slow  # 11.63s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_metrics_plot_descriptive_non_sequential_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
     new_cell: str = "data_assistant_result.plot_metrics(sequential=False)"
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,
@@ -2492,8 +1602,10 @@ def test_volume_data_assistant_metrics_plot_descriptive_non_sequential_notebook_
 
 @pytest.mark.integration
 @pytest.mark.slow  # 12.09s
+@pytest.mark.notebook_execution
 def test_volume_data_assistant_metrics_and_expectations_plot_descriptive_non_sequential_notebook_execution(
     bobby_columnar_table_multi_batch_probabilistic_data_context,
+    volume_data_assistant_notebook_runner: Callable,
 ):
     context: DataContext = bobby_columnar_table_multi_batch_probabilistic_data_context
 
@@ -2501,13 +1613,13 @@ def test_volume_data_assistant_metrics_and_expectations_plot_descriptive_non_seq
         "data_assistant_result.plot_expectations_and_metrics(sequential=False)"
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=False,
     )
 
-    run_volume_data_assistant_result_jupyter_notebook_with_new_cell(
+    volume_data_assistant_notebook_runner(
         context=context,
         new_cell=new_cell,
         implicit=True,